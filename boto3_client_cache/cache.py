@@ -24,7 +24,8 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import Iterator
 from inspect import signature
-from threading import RLock
+from sys import intern
+from threading import Lock
 from typing import Any, Generic, Literal, Tuple, TypeVar, get_args
 
 from boto3.resources.base import ServiceResource
@@ -51,6 +52,27 @@ CacheType = Literal["client", "resource"]
 _CacheObjType = TypeVar("_CacheObjType", BaseClient, ServiceResource)
 _CacheKeyType = TypeVar("_CacheKeyType", "ClientCacheKey", "ResourceCacheKey")
 
+# keys which may contain sensitive information to be obscured
+_SENSITIVE_KEYS = frozenset(
+    ("aws_access_key_id", "aws_secret_access_key", "aws_session_token")
+)
+
+# positions of args which may contain sensitive info, inferred once from the
+# public boto3 signatures (excluding ``self``) rather than on every key
+_SENSITIVE_ARG_POSITIONS: dict[CacheType, frozenset[int]] = {
+    cache_type: frozenset(
+        i
+        for i, name in enumerate(
+            name for name in signature(method).parameters if name != "self"
+        )
+        if name in _SENSITIVE_KEYS
+    )
+    for cache_type, method in (
+        ("client", Session.client),
+        ("resource", Session.resource),
+    )
+}
+
 
 class _AbstractCacheKey(ABC):
     """Abstract base class for cache keys.
@@ -58,6 +80,16 @@ class _AbstractCacheKey(ABC):
     .. versionadded:: 2.0.0
     """
 
+    __slots__ = (
+        "cache_type",
+        "key",
+        "_key",
+        "label",
+        "_label",
+        "_hash",
+        "__weakref__",
+    )
+
     def __init__(
         self, cache_type: CacheType | None = None, *args, **kwargs
     ) -> None:
@@ -75,6 +107,9 @@ class _AbstractCacheKey(ABC):
         # initializing the cache key and label
         self._create(*args, **kwargs)
 
+        # keys are immutable once created, so the hash is computed only once
+        self._hash = hash(self._key)
+
     def __str__(self) -> str:
         return self.label
 
@@ -86,7 +121,21 @@ class _AbstractCacheKey(ABC):
         return value
 
     def __hash__(self) -> int:
-        return hash(self._key)
+        return self._hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        # str hashes are randomized per process, so the cached hash is left
+        # out of the pickled state and recomputed when unpickling
+        return {
+            name: getattr(self, name)
+            for name in _AbstractCacheKey.__slots__
+            if name not in ("_hash", "__weakref__")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._hash = hash(self._key)
 
     @abstractmethod
     def __eq__(self, other: object) -> bool: ...
@@ -106,83 +155,61 @@ class _AbstractCacheKey(ABC):
         if "service_name" in kwargs:
             args = (kwargs.pop("service_name"),) + args
 
+        # interning the service name so equal keys built from runtime strings
+        # (e.g. config or env values) compare it by identity
+        if args and type(args[0]) is str:
+            args = (intern(args[0]),) + args[1:]
+
         # removing eviction_policy and max_size from kwargs if present
         if "eviction_policy" in kwargs:
             kwargs.pop("eviction_policy")
         if "max_size" in kwargs:
             kwargs.pop("max_size")
 
-        # defining keys which may contain sensitive information to be obscured
-        sensitive_keys = (
-            "aws_access_key_id",
-            "aws_secret_access_key",
-            "aws_session_token",
-        )
-
-        # inferring positions of args which may contain sensitive info
-        # based on the public function signature (excluding ``self``)
-        method = (
-            Session.client if self.cache_type == "client" else Session.resource
-        )
+        # positions of args which may contain sensitive info
+        sensitive_arg_positions = _SENSITIVE_ARG_POSITIONS[self.cache_type]
 
-        # filtering out "self" from the parameter names
-        parameter_names = tuple(
-            name for name in signature(method).parameters if name != "self"
-        )
-
-        # determining the positions of sensitive args based on keywords
-        sensitive_arg_positions = tuple(
-            i
-            for i, name in enumerate(parameter_names)
-            if name in sensitive_keys
-        )
+        # formatting each arg and kwarg once for both labels
+        arg_parts = [repr(a) for a in args]
+        kwarg_parts = [
+            (k, f"{k}={self._format_label_value(v)}")
+            for k, v in sorted(kwargs.items())
+        ]
 
         # creating a private clear-text label
         self._label: str = ", ".join(
-            [
-                *(repr(a) for a in args),
-                *(
-                    f"{k}={self._format_label_value(v)}"
-                    for k, v in sorted(kwargs.items())
-                ),
-            ]
+            [*arg_parts, *(part for _, part in kwarg_parts)]
         )
 
         # creating a public label with sensitive information obscured
         self.label: str = ", ".join(
             [
                 *(
-                    repr(a)
-                    if i not in sensitive_arg_positions
-                    else repr("***")
-                    for i, a in enumerate(args)
+                    part if i not in sensitive_arg_positions else "'***'"
+                    for i, part in enumerate(arg_parts)
                 ),
                 *(
-                    f"{k}={self._format_label_value(v)}"
-                    if k not in sensitive_keys
-                    else f"{k}=***"
-                    for k, v in sorted(kwargs.items())
+                    part if k not in _SENSITIVE_KEYS else f"{k}=***"
+                    for k, part in kwarg_parts
                 ),
             ]
         )
 
         # checking if Config was passed as a positional arg
-        # also preemptively obscuring args which may contain sensitive info
-        _args = [
-            self._config_cache_key(arg)
-            if isinstance(arg, Config)
-            else "***"
-            if i in sensitive_arg_positions
-            else arg
-            for i, arg in enumerate(args)
-        ]
-
-        # checking if Config was passed as a positional arg
+        # freezing it once and sharing it between the public and private keys
         _clear_args = [
             self._config_cache_key(arg) if isinstance(arg, Config) else arg
             for arg in args
         ]
 
+        # preemptively obscuring args which may contain sensitive info
+        _args = [
+            arg
+            if isinstance(args[i], Config) or i not in sensitive_arg_positions
+            else "***"
+            for i, arg in enumerate(_clear_args)
+        ]
+
         # popping trailing None values from args, preserving None in middle
         while _args and _args[-1] is None:
             _args.pop()
@@ -195,29 +222,19 @@ class _AbstractCacheKey(ABC):
         _clear_args = tuple(_clear_args)
 
         # checking if Config was passed as a keyword arg
-        _kwargs = kwargs.copy()
-        if _kwargs.get("config") is not None:
-            _kwargs["config"] = self._config_cache_key(_kwargs["config"])
-
-        # checking if Config was passed as a keyword arg
-        _clear_kwargs = kwargs.copy()
-        if _clear_kwargs.get("config") is not None:
+        # also preemptively removing None values from kwargs
+        _clear_kwargs = {
+            key: value for key, value in kwargs.items() if value is not None
+        }
+        if "config" in _clear_kwargs:
             _clear_kwargs["config"] = self._config_cache_key(
                 _clear_kwargs["config"]
             )
 
-        # preemptively removing None values from kwargs
-        # also obscuring kwarg values which may contain sensitive info
+        # obscuring kwarg values which may contain sensitive info
         _kwargs = {
-            key: value if key not in sensitive_keys else "***"
-            for key, value in _kwargs.items()
-            if value is not None
-        }
-
-        _clear_kwargs = {
-            key: value
+            key: value if key not in _SENSITIVE_KEYS else "***"
             for key, value in _clear_kwargs.items()
-            if value is not None
         }
 
         # creating a public unique key for the client cache
@@ -241,6 +258,10 @@ class _AbstractCacheKey(ABC):
         """
 
         match value:
+            # returning common hashable leaves without further checks
+            case str() | int() | float() | None:
+                return value
+
             # recursively freezing dicts
             case dict():
                 return tuple(
@@ -353,11 +374,16 @@ class ClientCacheKey(_AbstractCacheKey):
     >>> key = ClientCacheKey("s3", region_name="us-west-2")
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__("client", *args, **kwargs)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, ClientCacheKey) and self._key == other._key
+        # identical keys skip the tuple comparison entirely
+        return self is other or (
+            isinstance(other, ClientCacheKey) and self._key == other._key
+        )
 
     # inheriting the hash implementation from _AbstractCacheKey
     __hash__ = _AbstractCacheKey.__hash__
@@ -396,11 +422,16 @@ class ResourceCacheKey(_AbstractCacheKey):
     >>> key = ResourceCacheKey("s3", region_name="us-west-2")
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__("resource", *args, **kwargs)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, ResourceCacheKey) and self._key == other._key
+        # identical keys skip the tuple comparison entirely
+        return self is other or (
+            isinstance(other, ResourceCacheKey) and self._key == other._key
+        )
 
     # inheriting the hash implementation from _AbstractCacheKey
     __hash__ = _AbstractCacheKey.__hash__
@@ -450,6 +481,11 @@ class _AbstractCache(ABC, Generic[_CacheObjType, _CacheKeyType]):
         self,
     ) -> Tuple[Tuple[_CacheKeyType, _CacheObjType], ...]: ...
 
+    @abstractmethod
+    def iter_items(
+        self,
+    ) -> Iterator[Tuple[_CacheKeyType, _CacheObjType]]: ...
+
     @abstractmethod
     def get(
         self, key: _CacheKeyType, default: _CacheObjType | None = None
@@ -529,7 +565,7 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
         self.cache_type = cache_type or "client"
         self._max_size = abs(max_size if max_size is not None else 10)
         self._cache: OrderedDict[_CacheKeyType, _CacheObjType] = OrderedDict()
-        self._lock = RLock()
+        self._lock = Lock()
 
     @property
     def max_size(self) -> int:
@@ -568,12 +604,12 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
         return self.__str__()
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._cache)
+        # reading a dict's size is atomic, so no lock is needed
+        return len(self._cache)
 
     def __reversed__(self) -> Iterator[_CacheKeyType]:
         with self._lock:
-            return iter(tuple(reversed(self._cache.keys())))
+            return iter(tuple(reversed(self._cache)))
 
     def __contains__(self, key: _CacheKeyType) -> bool:
         with self._lock:
@@ -581,21 +617,22 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
 
     def __iter__(self) -> Iterator[_CacheKeyType]:
         with self._lock:
-            return iter(tuple(self._cache.keys()))
+            return iter(tuple(self._cache))
 
     def __getitem__(self, key: _CacheKeyType) -> _CacheObjType:
         with self._lock:
-            # move obj to end of cache to mark it as recently used
-            if key in self._cache:
+            # move obj to end of cache to mark it as recently used;
+            # move_to_end doubles as the membership check, saving a lookup
+            try:
                 self._cache.move_to_end(key)
-                return self._cache[key]
-            else:
+            except KeyError:
                 msg = "The client you requested has not been cached."
                 match self.cache_type:
                     case "client":
                         raise ClientCacheNotFoundError(msg) from None
                     case _:
                         raise ResourceCacheNotFoundError(msg) from None
+            return self._cache[key]
 
     def __setitem__(self, key: _CacheKeyType, obj: _CacheObjType) -> None:
         if not isinstance(key, _AbstractCacheKey):
@@ -654,7 +691,7 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
         """Returns the keys in the cache."""
 
         with self._lock:
-            return tuple(self._cache.keys())
+            return tuple(self._cache)
 
     def values(self) -> Tuple[_CacheObjType, ...]:
         """Returns the values from the cache."""
@@ -669,6 +706,25 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
         with self._lock:
             return tuple(self._cache.items())
 
+    def iter_items(self) -> Iterator[Tuple[_CacheKeyType, _CacheObjType]]:
+        """Lazily yields the items in the cache as (_CacheKeyType,
+        _CacheObjType) tuples.
+
+        Only the keys are snapshotted while holding the lock; each value is
+        looked up as it is yielded, and items removed in the meantime are
+        skipped. Prefer this over :meth:`items` when iterating once over a
+        large cache.
+        """
+
+        with self._lock:
+            keys = tuple(self._cache)
+
+        for key in keys:
+            with self._lock:
+                obj = self._cache.get(key)
+            if obj is not None:
+                yield key, obj
+
     def get(
         self, key: _CacheKeyType, default: _CacheObjType | None = None
     ) -> _CacheObjType | None:
@@ -676,9 +732,11 @@ class _BaseLRUCache(_AbstractCache, Generic[_CacheObjType, _CacheKeyType]):
 
         with self._lock:
             # move obj to end of cache to mark it as recently used
-            if key in self._cache:
+            try:
                 self._cache.move_to_end(key)
-            return self._cache.get(key, default)
+            except KeyError:
+                return default
+            return self._cache[key]
 
     def pop(self, key: _CacheKeyType) -> _CacheObjType:
         """Pops and returns the object associated with the given key."""
@@ -773,6 +831,8 @@ class LRUClientCache(
         Gets the client associated with the given key, or returns the default.
     items() -> Tuple[Tuple[ClientCacheKey, BaseClient], ...]
         Returns the items in the cache as (key, client) tuples.
+    iter_items() -> Iterator[Tuple[ClientCacheKey, BaseClient]]
+        Lazily yields the items in the cache as (key, client) tuples.
     keys() -> Tuple[ClientCacheKey, ...]
         Returns the keys in the cache.
     pop(key: ClientCacheKey) -> BaseClient
@@ -856,6 +916,8 @@ class LRUResourceCache(
         default.
     items() -> Tuple[Tuple[ResourceCacheKey, ServiceResource], ...]
         Returns the items in the cache as (key, resource) tuples.
+    iter_items() -> Iterator[Tuple[ResourceCacheKey, ServiceResource]]
+        Lazily yields the items in the cache as (key, resource) tuples.
     keys() -> Tuple[ResourceCacheKey, ...]
         Returns the keys in the cache.
     pop(key: ResourceCacheKey) -> ServiceResource
@@ -893,6 +955,8 @@ class LRUResourceCache(
 class _FrequencyNode(Generic[_CacheKeyType]):
     """Internal node for a specific frequency in the LFU index."""
 
+    __slots__ = ("frequency", "keys", "prev", "next")
+
     def __init__(self, frequency: int) -> None:
         self.frequency = frequency
         self.keys: OrderedDict[_CacheKeyType, None] = OrderedDict()
@@ -908,6 +972,8 @@ class _FrequencyIndex(Generic[_CacheKeyType]):
     with the same access frequency.
     """
 
+    __slots__ = ("_head", "_tail", "_key_to_node")
+
     def __init__(self) -> None:
         self._head: _FrequencyNode[_CacheKeyType] | None = None
         self._tail: _FrequencyNode[_CacheKeyType] | None = None
@@ -917,7 +983,7 @@ class _FrequencyIndex(Generic[_CacheKeyType]):
 
     def insert(self, key: _CacheKeyType) -> None:
         if self._head is None or self._head.frequency != 1:
-            node = _FrequencyNode[_CacheKeyType](1)
+            node = _FrequencyNode(1)
             self._insert_before(self._head, node)
         else:
             node = self._head
@@ -931,7 +997,7 @@ class _FrequencyIndex(Generic[_CacheKeyType]):
         target = current.next
 
         if target is None or target.frequency != target_frequency:
-            target = _FrequencyNode[_CacheKeyType](target_frequency)
+            target = _FrequencyNode(target_frequency)
             self._insert_after(current, target)
 
         del current.keys[key]
@@ -960,6 +1026,16 @@ class _FrequencyIndex(Generic[_CacheKeyType]):
             yield from current.keys
             current = current.next
 
+    def iter_items(
+        self, mapping: dict[_CacheKeyType, Any]
+    ) -> Iterator[Tuple[_CacheKeyType, Any]]:
+        getitem = mapping.__getitem__
+        current = self._head
+        while current is not None:
+            for key in current.keys:
+                yield key, getitem(key)
+            current = current.next
+
     def iter_keys_reversed(self) -> Iterator[_CacheKeyType]:
         current = self._tail
         while current is not None:
@@ -967,12 +1043,12 @@ class _FrequencyIndex(Generic[_CacheKeyType]):
             current = current.prev
 
     def copy(self) -> "_FrequencyIndex[_CacheKeyType]":
-        clone = _FrequencyIndex[_CacheKeyType]()
+        clone = _FrequencyIndex()
         current = self._head
         previous_clone_node: _FrequencyNode[_CacheKeyType] | None = None
 
         while current is not None:
-            clone_node = _FrequencyNode[_CacheKeyType](current.frequency)
+            clone_node = _FrequencyNode(current.frequency)
             clone_node.keys = current.keys.copy()
 
             if clone._head is None:
@@ -1064,7 +1140,7 @@ class _BaseLFUCache(
         self._max_size = abs(max_size if max_size is not None else 10)
         self._cache: dict[_CacheKeyType, _CacheObjType] = {}
         self._frequencies: _FrequencyIndex[_CacheKeyType] = _FrequencyIndex()
-        self._lock = RLock()
+        self._lock = Lock()
 
     @property
     def max_size(self) -> int:
@@ -1101,8 +1177,8 @@ class _BaseLFUCache(
         return self.__str__()
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._cache)
+        # reading a dict's size is atomic, so no lock is needed
+        return len(self._cache)
 
     def __reversed__(self) -> Iterator[_CacheKeyType]:
         with self._lock:
@@ -1203,15 +1279,33 @@ class _BaseLFUCache(
         """Returns the values in LFU order."""
 
         with self._lock:
-            keys = tuple(self._frequencies.iter_keys())
-            return tuple(self._cache[key] for key in keys)
+            return tuple(
+                map(self._cache.__getitem__, self._frequencies.iter_keys())
+            )
 
     def items(self) -> Tuple[Tuple[_CacheKeyType, _CacheObjType], ...]:
         """Returns the items in LFU order."""
 
+        with self._lock:
+            return tuple(self._frequencies.iter_items(self._cache))
+
+    def iter_items(self) -> Iterator[Tuple[_CacheKeyType, _CacheObjType]]:
+        """Lazily yields the items in LFU order.
+
+        Only the keys are snapshotted while holding the lock; each value is
+        looked up as it is yielded, and items removed in the meantime are
+        skipped. Iterating does not count as an access. Prefer this over
+        :meth:`items` when iterating once over a large cache.
+        """
+
         with self._lock:
             keys = tuple(self._frequencies.iter_keys())
-            return tuple((key, self._cache[key]) for key in keys)
+
+        for key in keys:
+            with self._lock:
+                obj = self._cache.get(key)
+            if obj is not None:
+                yield key, obj
 
     def get(
         self, key: _CacheKeyType, default: _CacheObjType | None = None
@@ -1324,6 +1418,8 @@ class LFUClientCache(
         Gets the client associated with the given key, or returns the default.
     items() -> Tuple[Tuple[ClientCacheKey, BaseClient], ...]
         Returns the items in the cache as (key, client) tuples.
+    iter_items() -> Iterator[Tuple[ClientCacheKey, BaseClient]]
+        Lazily yields the items in the cache as (key, client) tuples.
     keys() -> Tuple[ClientCacheKey, ...]
         Returns the keys in the cache.
     pop(key: ClientCacheKey) -> BaseClient
@@ -1414,6 +1510,8 @@ class LFUResourceCache(
         default.
     items() -> Tuple[Tuple[ResourceCacheKey, ServiceResource], ...]
         Returns the items in the cache as (key, resource) tuples.
+    iter_items() -> Iterator[Tuple[ResourceCacheKey, ServiceResource]]
+        Lazily yields the items in the cache as (key, resource) tuples.
     keys() -> Tuple[ResourceCacheKey, ...]
         Returns the keys in the cache.
     pop(key: ResourceCacheKey) -> ServiceResource
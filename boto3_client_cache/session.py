@@ -59,6 +59,9 @@ from .cache import (
 )
 from .exceptions import ClientCacheError, ResourceCacheError
 
+# supported eviction policies, resolved once rather than on every call
+_EVICTION_POLICIES: tuple[EvictionPolicy, ...] = get_args(EvictionPolicy)
+
 
 class SessionClientCache:
     """Class representing the client cache for a session, which contains
@@ -67,6 +70,8 @@ class SessionClientCache:
     .. versionadded:: 2.1.0
     """
 
+    __slots__ = ("LRU", "LFU")
+
     def __init__(self) -> None:
         self.LRU = ClientCache()
         self.LFU = ClientCache("LFU")
@@ -82,6 +87,8 @@ class SessionResourceCache:
     .. versionadded:: 2.1.0
     """
 
+    __slots__ = ("LRU", "LFU")
+
     def __init__(self) -> None:
         self.LRU = ResourceCache()
         self.LFU = ResourceCache("LFU")
@@ -97,6 +104,8 @@ class SessionCache:
     .. versionadded:: 2.1.0
     """
 
+    __slots__ = ("client", "resource")
+
     def __init__(self) -> None:
         self.client = SessionClientCache()
         self.resource = SessionResourceCache()
@@ -224,37 +233,38 @@ class Session(boto3.Session):
         True
         """
 
-        try:
-            # validating eviction policy
-            assert eviction_policy is None or eviction_policy in get_args(
-                EvictionPolicy
-            )
-        except AssertionError:
+        # validating eviction policy
+        if (
+            eviction_policy is not None
+            and eviction_policy not in _EVICTION_POLICIES
+        ):
             raise ClientCacheError(
                 f"Invalid eviction policy: {eviction_policy}. "
-                f"Valid options are: {get_args(EvictionPolicy)}."
+                f"Valid options are: {_EVICTION_POLICIES}."
             )
 
         # setting default eviction policy to "LRU" if None is provided
         eviction_policy = eviction_policy or "LRU"
 
+        # resolving the cache for this eviction policy once per call
+        cache = getattr(self.cache.client, eviction_policy)
+
         # creating a cache key based on the client initialization parameters
         key = ClientCacheKey(*args, **kwargs)
 
-        # initializing the client if it doesn't exist in the cache yet
-        if key not in self.cache.client[eviction_policy]:
-            self.cache["client"][eviction_policy][key] = super().client(
-                *args, **kwargs
-            )
+        # a hit returns the client from a single lookup with the key above;
+        # a miss initializes the client and caches it
+        client = cache.get(key)
+        if client is None:
+            cache[key] = super().client(*args, **kwargs)
 
         # updating the max_size of the client cache if it has changed
-        if (
-            max_size is not None
-            and max_size != self.cache["client"][eviction_policy].max_size
-        ):
-            self.cache["client"][eviction_policy].max_size = max_size
+        if max_size is not None and max_size != cache.max_size:
+            cache.max_size = max_size
 
-        return self.cache["client"][eviction_policy][key]
+        if client is None:
+            client = cache[key]
+        return client
 
     def resource(  # type: ignore[override]
         self,
@@ -324,37 +334,38 @@ class Session(boto3.Session):
         True
         """
 
-        try:
-            # validating eviction policy
-            assert eviction_policy is None or eviction_policy in get_args(
-                EvictionPolicy
-            )
-        except AssertionError:
+        # validating eviction policy
+        if (
+            eviction_policy is not None
+            and eviction_policy not in _EVICTION_POLICIES
+        ):
             raise ResourceCacheError(
                 f"Invalid eviction policy: {eviction_policy}. "
-                f"Valid options are: {get_args(EvictionPolicy)}."
+                f"Valid options are: {_EVICTION_POLICIES}."
             )
 
         # setting default eviction policy to "LRU" if None is provided
         eviction_policy = eviction_policy or "LRU"
 
+        # resolving the cache for this eviction policy once per call
+        cache = getattr(self.cache.resource, eviction_policy)
+
         # creating a cache key based on the resource initialization parameters
         key = ResourceCacheKey(*args, **kwargs)
 
-        # initializing the resource if it doesn't exist in the cache yet
-        if key not in self.cache["resource"][eviction_policy]:
-            self.cache["resource"][eviction_policy][key] = super().resource(
-                *args, **kwargs
-            )
+        # a hit returns the resource from a single lookup with the key above;
+        # a miss initializes the resource and caches it
+        resource = cache.get(key)
+        if resource is None:
+            cache[key] = super().resource(*args, **kwargs)
 
         # updating the max_size of the resource cache if it has changed
-        if (
-            max_size is not None
-            and max_size != self.cache["resource"][eviction_policy].max_size
-        ):
-            self.cache["resource"][eviction_policy].max_size = max_size
+        if max_size is not None and max_size != cache.max_size:
+            cache.max_size = max_size
 
-        return self.cache["resource"][eviction_policy][key]
+        if resource is None:
+            resource = cache[key]
+        return resource
 
 
 def setup_default_session(**kwargs) -> Session:
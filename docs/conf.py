@@ -1,37 +1,51 @@
+import ast
+import functools
 import importlib
 import inspect
+import linecache
+import operator
 import os
 import sys
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
+from types import ModuleType
 
-import tomlkit
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
 
 # fetching pyproject.toml
 path = Path("../pyproject.toml")
 
-with path.open("r", encoding="utf-8") as f:
-    pyproject = tomlkit.parse(f.read())
+with path.open("rb") as f:
+    pyproject = tomllib.load(f)
+project_table = pyproject["project"]
+project_urls = project_table["urls"]
 
 # sphinx config
 sys.path.insert(0, os.path.abspath("."))
 sys.path.insert(0, os.path.abspath(".."))
 language = "en"
-project = str(pyproject["project"]["name"])  # type: ignore
+project = project_table["name"]
 author = "Michael Letts"
 copyright = f"{date.today().year}, {author}"
-release = str(pyproject["project"]["version"])  # type: ignore
+release = project_table["version"]
 source_encoding = "utf-8"
 source_suffix = ".rst"
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",
     "sphinx.ext.intersphinx",
+    "sphinx.ext.duration",
     "sphinx.ext.linkcode",
     "numpydoc",
-    "sphinx_copybutton",
-    "sphinxext.opengraph",
 ]
+
+# HTML-only extensions; set SPHINX_MINIMAL=1 to skip them on local rebuilds
+if os.environ.get("SPHINX_MINIMAL") != "1":
+    extensions += ["sphinx_copybutton", "sphinxext.opengraph"]
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
@@ -42,10 +56,9 @@ html_theme = "furo"
 html_static_path = ["_static"]
 html_file_suffix = ".html"
 htmlhelp_basename = project
-html_baseurl = str(pyproject["project"]["urls"]["Documentation"]).rstrip("/")  # type: ignore
-repository_url = str(pyproject["project"]["urls"]["Repository"]).rstrip("/")  # type: ignore
+html_baseurl = project_urls["Documentation"].rstrip("/")
+repository_url = project_urls["Repository"].rstrip("/")
 repository_branch = "main"
-repository_root = Path(__file__).resolve().parent.parent
 html_favicon = "_static/favicon.ico"
 
 html_theme_options = {
@@ -60,9 +73,14 @@ ogp_description_length = 100
 ogp_description = "A concurrency-safe, bounded cache for boto3 clients and resources with deterministic identity semantics."
 
 # autosummary config
-autosummary_generate = True
+# Sphinx only rewrites stubs whose content changed, and the stubs under
+# reference/ are committed, so minimal local rebuilds skip regenerating them
+autosummary_generate = os.environ.get("SPHINX_MINIMAL") != "1"
 
 # autodoc config
+# autodoc is kept over sphinx-autoapi: each module (and boto3) is imported
+# once per build and reused by linkcode_resolve through sys.modules, whereas
+# autoapi would replace the numpydoc-rendered autosummary pages in reference/
 autodoc_default_options = {
     "members": True,
     "member-order": "alphabetical",
@@ -92,34 +110,149 @@ intersphinx_mapping = {
 }
 
 
+# linkcode caches below are plain per-process globals, so parallel builds
+# (-j auto) give each worker its own copy and nothing needs to be shared
+
+# modules imported by linkcode_resolve, including failed imports as None
+_module_cache: dict[str, ModuleType | None] = {}
+
+
+def _cached_import(module_name: str) -> ModuleType | None:
+    """Imports a module once, checking sys.modules before importlib."""
+
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    if module_name in _module_cache:
+        return _module_cache[module_name]
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module = None
+
+    _module_cache[module_name] = module
+    return module
+
+
+@functools.cache
+def _repo_root() -> Path:
+    """Resolves the repository root on first use."""
+
+    return Path(__file__).resolve().parent.parent
+
+
+# repository-relative POSIX paths keyed on source file, None if outside repo
+_resolved_path_cache: dict[str, str | None] = {}
+
+
+def _relpath(source_file: str) -> str | None:
+    """Resolves a source file relative to the repository root once."""
+
+    if source_file in _resolved_path_cache:
+        return _resolved_path_cache[source_file]
+
+    try:
+        relative_path = (
+            Path(source_file).resolve().relative_to(_repo_root()).as_posix()
+        )
+    except ValueError:
+        relative_path = None
+
+    _resolved_path_cache[source_file] = relative_path
+    return relative_path
+
+
+@functools.cache
+def _line_ranges(source_file: str) -> dict[str, tuple[int, int]]:
+    """Maps qualified names of classes and functions in a source file to
+    their (start, end) lines, parsing the file only once."""
+
+    try:
+        tree = ast.parse("".join(linecache.getlines(source_file)))
+    except SyntaxError:
+        return {}
+
+    ranges: dict[str, tuple[int, int]] = {}
+    pending: list[tuple[ast.AST, str]] = [(tree, "")]
+    while pending:
+        node, prefix = pending.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                child_prefix = f"{prefix}{child.name}."
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                child_prefix = f"{prefix}{child.name}.<locals>."
+            else:
+                continue
+
+            # matching inspect, which starts the block at the first decorator
+            start_line = min(
+                [child.lineno, *(d.lineno for d in child.decorator_list)]
+            )
+            ranges[f"{prefix}{child.name}"] = (start_line, child.end_lineno)
+            pending.append((child, child_prefix))
+
+    return ranges
+
+
+def _line_range(obj, source_file: str | None) -> tuple[int, int]:
+    """Finds the source lines of an object, preferring the per-file index
+    over re-tokenizing the object's source with inspect."""
+
+    qualname = getattr(obj, "__qualname__", None)
+    if source_file is not None and isinstance(qualname, str):
+        line_range = _line_ranges(source_file).get(qualname)
+        if line_range is not None:
+            return line_range
+
+    source_lines, start_line = inspect.getsourcelines(obj)
+    return start_line, start_line + len(source_lines) - 1
+
+
+# dotted-path getters shared across modules documenting the same fullname
+_attrgetter = functools.cache(operator.attrgetter)
+
+
+# resolved source links keyed on (domain, module, fullname)
+_linkcode_cache: dict[tuple[str, str, str], str | None] = {}
+
+
 def linkcode_resolve(domain, info) -> str | None:
     """Resolves 'source' link in documentation."""
 
+    cache_key = (domain, info.get("module", ""), info.get("fullname", ""))
+    if cache_key in _linkcode_cache:
+        return _linkcode_cache[cache_key]
+
+    url = _resolve_source_url(*cache_key)
+    _linkcode_cache[cache_key] = url
+    return url
+
+
+def _resolve_source_url(
+    domain: str, module_name: str, fullname: str
+) -> str | None:
     if domain != "py":
         return None
-    module_name = info.get("module")
     if not module_name:
         return None
 
-    try:
-        module = importlib.import_module(module_name)
-    except ImportError:
+    module = _cached_import(module_name)
+    if module is None:
         return None
 
     obj = module
-    fullname = info.get("fullname")
     if fullname:
-        for part in fullname.split("."):
-            obj = getattr(obj, part, None)
-            if obj is None:
-                break
+        try:
+            obj = _attrgetter(fullname)(module)
+        except AttributeError:
+            obj = None
 
     try:
         if obj is not None:
             obj = inspect.unwrap(obj)  # type: ignore
             source_file = inspect.getsourcefile(obj)
-            source_lines, start_line = inspect.getsourcelines(obj)
-            end_line = start_line + len(source_lines) - 1
+            start_line, end_line = _line_range(obj, source_file)
         else:
             source_file = None
             start_line = None
@@ -134,17 +267,56 @@ def linkcode_resolve(domain, info) -> str | None:
         if source_file is None:
             return None
 
-    try:
+    relative_path = _relpath(source_file)
+    if relative_path is None:
         relative_path = (
-            Path(source_file).resolve().relative_to(repository_root)
+            Path(*module_name.split(".")).with_suffix(".py").as_posix()
         )
-    except ValueError:
-        relative_path = Path(*module_name.split(".")).with_suffix(".py")
 
-    url = (
-        f"{repository_url}/blob/{repository_branch}/{relative_path.as_posix()}"
-    )
+    url = f"{repository_url}/blob/{repository_branch}/{relative_path}"
     if start_line is not None and end_line is not None:
         return f"{url}#L{start_line}-L{end_line}"
 
     return url
+
+
+def _documented_symbols(srcdir: str) -> Iterator[tuple[str, str]]:
+    """Yields (module, fullname) pairs listed in the autosummary stubs."""
+
+    for stub in sorted(Path(srcdir, "reference").glob("*.rst")):
+        module_name = None
+        for line in stub.read_text(encoding="utf-8").splitlines():
+            stripped = line.strip()
+            if stripped.startswith(".. automodule::"):
+                module_name = stripped.split("::", 1)[1].strip()
+                yield module_name, ""
+            elif module_name is not None and stripped.isidentifier():
+                yield module_name, stripped
+
+
+def _prewarm_linkcode(app) -> None:
+    """Resolves the documented symbols and their public members in one pass
+    before reading starts, so parallel workers inherit a warm cache."""
+
+    for module_name, fullname in _documented_symbols(app.srcdir):
+        linkcode_resolve("py", {"module": module_name, "fullname": fullname})
+
+        module = _cached_import(module_name)
+        obj = getattr(module, fullname, None) if fullname else None
+        if not inspect.isclass(obj):
+            continue
+
+        for member in dir(obj):
+            if not member.startswith("_"):
+                linkcode_resolve(
+                    "py",
+                    {
+                        "module": module_name,
+                        "fullname": f"{fullname}.{member}",
+                    },
+                )
+
+
+def setup(app) -> None:
+    # connected after autosummary so freshly generated stubs are included
+    app.connect("builder-inited", _prewarm_linkcode)
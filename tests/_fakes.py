@@ -0,0 +1,36 @@
+from boto3.resources.base import ServiceResource
+from botocore.client import BaseClient
+
+
+class FakeClient(BaseClient):
+    # subclassing satisfies the cache's isinstance check without running
+    # BaseClient.__init__ or MagicMock's spec introspection
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __getattr__(self, name: str) -> object:
+        # BaseClient.__getattr__ expects a fully initialized client
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"FakeClient({self.name!r})"
+
+
+class FakeResource(ServiceResource):
+    # subclassing satisfies the cache's isinstance check without running
+    # ServiceResource.__init__, which builds a real client
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other: object) -> bool:
+        # ServiceResource compares identifiers from ``meta``, which is unset
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __repr__(self) -> str:
+        return f"FakeResource({self.name!r})"
@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+import pytest
+
+from boto3_client_cache.cache import ClientCacheKey, ResourceCacheKey
+
+
+@pytest.fixture(scope="session")
+def client_keys() -> SimpleNamespace:
+    return SimpleNamespace(
+        s3=ClientCacheKey("s3"),
+        sns=ClientCacheKey("sns"),
+        sqs=ClientCacheKey("sqs"),
+        missing=ClientCacheKey("missing"),
+    )
+
+
+@pytest.fixture(scope="session")
+def resource_keys() -> SimpleNamespace:
+    return SimpleNamespace(
+        s3=ResourceCacheKey("s3"),
+        sns=ResourceCacheKey("sns"),
+        sqs=ResourceCacheKey("sqs"),
+        missing=ResourceCacheKey("missing"),
+    )
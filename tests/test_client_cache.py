@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock
+import pickle
+import weakref
+from collections.abc import Callable
+from types import SimpleNamespace
 
 import pytest
 from botocore.client import BaseClient
@@ -17,12 +20,16 @@ from boto3_client_cache.exceptions import (
     ClientCacheNotFoundError,
 )
 
+from ._fakes import FakeClient
+
 
 def _client(name: str = "client") -> BaseClient:
-    return MagicMock(spec=BaseClient, name=name)
+    return FakeClient(name)
 
 
 class _TrackingLock:
+    __slots__ = ("enter_count", "exit_count")
+
     def __init__(self) -> None:
         self.enter_count = 0
         self.exit_count = 0
@@ -36,6 +43,61 @@ class _TrackingLock:
         return False
 
 
+_ClientCacheType = LRUClientCache | LFUClientCache
+_CACHE_CLASSES = [LRUClientCache, LFUClientCache]
+
+# equal configs built with differently ordered kwargs
+_CONFIG_ONE = Config(
+    region_name="us-east-1",
+    retries={"mode": "standard", "max_attempts": 3},
+)
+_CONFIG_TWO = Config(
+    retries={"max_attempts": 3, "mode": "standard"},
+    region_name="us-east-1",
+)
+
+_SENSITIVE_KEYWORD_VALUES = [
+    ("aws_access_key_id", "AKIA_TEST_KEY"),
+    ("aws_secret_access_key", "SECRET_TEST_KEY"),
+    ("aws_session_token", "SESSION_TEST_TOKEN"),
+]
+_SENSITIVE_POSITIONAL_VALUES = [
+    (6, "AKIA_TEST_KEY"),
+    (7, "SECRET_TEST_KEY"),
+    (8, "SESSION_TEST_TOKEN"),
+]
+
+
+# each operation runs against a cache already holding ``keys.s3``
+_LOCKED_OPERATIONS = [
+    pytest.param(
+        lambda cache, keys: cache.__setitem__(keys.sqs, _client("new")),
+        id="setitem",
+    ),
+    pytest.param(lambda cache, keys: cache.get(keys.s3), id="get"),
+    pytest.param(lambda cache, keys: cache[keys.s3], id="getitem"),
+    pytest.param(lambda cache, keys: cache.__delitem__(keys.s3), id="delitem"),
+    pytest.param(lambda cache, keys: list(cache), id="iter"),
+    pytest.param(lambda cache, keys: list(reversed(cache)), id="reversed"),
+    pytest.param(lambda cache, keys: keys.s3 in cache, id="contains"),
+    pytest.param(lambda cache, keys: cache.keys(), id="keys"),
+    pytest.param(lambda cache, keys: cache.values(), id="values"),
+    pytest.param(lambda cache, keys: cache.items(), id="items"),
+    pytest.param(
+        lambda cache, keys: list(cache.iter_items()), id="iter_items"
+    ),
+    pytest.param(lambda cache, keys: str(cache), id="str"),
+    pytest.param(lambda cache, keys: repr(cache), id="repr"),
+    pytest.param(
+        lambda cache, keys: setattr(cache, "max_size", 10), id="max_size"
+    ),
+    pytest.param(lambda cache, keys: cache.pop(keys.s3), id="pop"),
+    pytest.param(lambda cache, keys: cache.popitem(), id="popitem"),
+    pytest.param(lambda cache, keys: cache.copy(), id="copy"),
+    pytest.param(lambda cache, keys: cache.clear(), id="clear"),
+]
+
+
 def test_client_cache_key_equality_hash_str_and_repr() -> None:
     first = ClientCacheKey("s3", region_name="us-east-1")
     second = ClientCacheKey("s3", region_name="us-east-1")
@@ -47,6 +109,30 @@ def test_client_cache_key_equality_hash_str_and_repr() -> None:
     assert str(first) == first.label
     assert repr(first) == f"ClientCacheKey(client({first.label}))"
 
+    # equality depends only on the key, never on a (possibly stale) hash
+    stale = ClientCacheKey("s3", region_name="us-east-1")
+    stale._hash ^= 1
+    assert stale == first
+
+
+def test_client_cache_key_recomputes_hash_when_unpickled() -> None:
+    key = ClientCacheKey("s3", region_name="us-east-1")
+    fresh = ClientCacheKey("s3", region_name="us-east-1")
+
+    # simulating a key hashed in another process with a different hash seed
+    key._hash = hash(key._key) ^ 1
+    loaded = pickle.loads(pickle.dumps(key))
+
+    assert hash(loaded) == hash(fresh)
+    assert loaded == fresh
+    assert loaded in {fresh: "client"}
+    assert loaded.label == fresh.label
+
+
+def test_client_cache_key_supports_weak_references() -> None:
+    key = ClientCacheKey("s3")
+    assert weakref.ref(key)() is key
+
 
 def test_client_cache_key_normalizes_none_and_sorts_kwargs() -> None:
     key = ClientCacheKey(
@@ -71,7 +157,6 @@ def test_client_cache_key_moves_service_name_kwarg_into_args() -> None:
     assert keyword == positional
     assert hash(keyword) == hash(positional)
     assert keyword.key == positional.key
-    assert keyword._key == positional._key
     assert keyword.label == positional.label
     assert keyword._label == positional._label
     assert "service_name=" not in keyword.label
@@ -91,17 +176,20 @@ def test_client_cache_key_removes_session_cache_control_kwargs() -> None:
 
     assert with_controls == plain
     assert with_controls.key == plain.key
-    assert with_controls._key == plain._key
     assert with_controls.label == plain.label
     assert with_controls._label == plain._label
     assert "eviction_policy=" not in with_controls.label
     assert "eviction_policy=" not in with_controls._label
     assert "max_size=" not in with_controls.label
     assert "max_size=" not in with_controls._label
-    assert "eviction_policy" not in dict(with_controls.key[1])
-    assert "eviction_policy" not in dict(with_controls._key[1])
-    assert "max_size" not in dict(with_controls.key[1])
-    assert "max_size" not in dict(with_controls._key[1])
+
+    public_kwargs = dict(with_controls.key[1])
+    private_kwargs = dict(with_controls._key[1])
+
+    assert "eviction_policy" not in public_kwargs
+    assert "eviction_policy" not in private_kwargs
+    assert "max_size" not in public_kwargs
+    assert "max_size" not in private_kwargs
 
 
 def test_client_cache_key_freezes_nested_values() -> None:
@@ -117,19 +205,10 @@ def test_client_cache_key_freezes_nested_values() -> None:
 
 
 def test_client_cache_key_config_key_is_stable_between_instances() -> None:
-    config_one = Config(
-        region_name="us-east-1",
-        retries={"mode": "standard", "max_attempts": 3},
-    )
-    config_two = Config(
-        retries={"max_attempts": 3, "mode": "standard"},
-        region_name="us-east-1",
-    )
-
-    positional_one = ClientCacheKey("s3", config_one)
-    positional_two = ClientCacheKey("s3", config_two)
-    keyword_one = ClientCacheKey("s3", config=config_one)
-    keyword_two = ClientCacheKey("s3", config=config_two)
+    positional_one = ClientCacheKey("s3", _CONFIG_ONE)
+    positional_two = ClientCacheKey("s3", _CONFIG_TWO)
+    keyword_one = ClientCacheKey("s3", config=_CONFIG_ONE)
+    keyword_two = ClientCacheKey("s3", config=_CONFIG_TWO)
 
     assert positional_one.key == positional_two.key
     assert keyword_one.key == keyword_two.key
@@ -150,70 +229,50 @@ def test_client_cache_key_config_falls_back_to___dict__when_needed() -> None:
     assert "region_name='us-east-1'" in formatted
 
 
-@pytest.mark.parametrize(
-    ("sensitive_key", "value"),
-    [
-        ("aws_access_key_id", "AKIA_TEST_KEY"),
-        ("aws_secret_access_key", "SECRET_TEST_KEY"),
-        ("aws_session_token", "SESSION_TEST_TOKEN"),
-    ],
-)
-def test_client_cache_key_obscures_sensitive_keyword_values(
-    sensitive_key: str,
-    value: str,
-) -> None:
-    key = ClientCacheKey(
-        "s3", region_name="us-east-1", **{sensitive_key: value}
-    )
-
-    assert f"{sensitive_key}=***" in key.label
-    assert value not in key.label
-    assert f"{sensitive_key}={value!r}" in key._label
-
-    public_kwargs = dict(key.key[1])
-    private_kwargs = dict(key._key[1])
-
-    assert public_kwargs[sensitive_key] == "***"
-    assert private_kwargs[sensitive_key] == value
-    assert public_kwargs["region_name"] == "us-east-1"
-    assert private_kwargs["region_name"] == "us-east-1"
-
-
-@pytest.mark.parametrize(
-    ("arg_position", "value"),
-    [
-        (6, "AKIA_TEST_KEY"),
-        (7, "SECRET_TEST_KEY"),
-        (8, "SESSION_TEST_TOKEN"),
-    ],
-)
-def test_client_cache_key_obscures_sensitive_positional_values(
-    arg_position: int,
-    value: str,
-) -> None:
-    args: list[object | None] = [
-        "s3",
-        None,
-        None,
-        None,
-        None,
-        None,
-        None,
-        None,
-        None,
-    ]
-    args[arg_position] = value
-    key = ClientCacheKey(*args)
-
-    assert value not in key.label
-    assert value in key._label
-    assert key.key[0][arg_position] == "***"
-    assert key._key[0][arg_position] == value
-
-
-def test_client_cache_key_print_and_repr_do_not_expose_sensitive_data(
-    capsys: pytest.CaptureFixture[str],
-) -> None:
+def test_client_cache_key_obscures_sensitive_keyword_values() -> None:
+    for sensitive_key, value in _SENSITIVE_KEYWORD_VALUES:
+        key = ClientCacheKey(
+            "s3", region_name="us-east-1", **{sensitive_key: value}
+        )
+
+        assert f"{sensitive_key}=***" in key.label
+        assert value not in key.label
+        assert f"{sensitive_key}={value!r}" in key._label
+
+        public_kwargs = dict(key.key[1])
+        private_kwargs = dict(key._key[1])
+
+        assert public_kwargs[sensitive_key] == "***"
+        assert private_kwargs[sensitive_key] == value
+        assert public_kwargs["region_name"] == "us-east-1"
+        assert private_kwargs["region_name"] == "us-east-1"
+
+
+def test_client_cache_key_obscures_sensitive_positional_values() -> None:
+    for arg_position, value in _SENSITIVE_POSITIONAL_VALUES:
+        args: list[object | None] = [
+            "s3",
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+        ]
+        args[arg_position] = value
+        key = ClientCacheKey(*args)
+
+        assert value not in key.label
+        assert value in key._label
+        assert key.key[0][arg_position] == "***"
+        assert key._key[0][arg_position] == value
+
+
+def test_client_cache_key_print_and_repr_do_not_expose_sensitive_data() -> (
+    None
+):
     key = ClientCacheKey(
         "s3",
         aws_access_key_id="AKIA_TEST_KEY",
@@ -221,9 +280,8 @@ def test_client_cache_key_print_and_repr_do_not_expose_sensitive_data(
         aws_session_token="SESSION_TEST_TOKEN",
     )
 
-    print(key)
-    print([key])
-    captured = capsys.readouterr().out
+    # mirrors what print(key) and print([key]) would write
+    captured = f"{key}\n{[key]!r}\n"
 
     assert "AKIA_TEST_KEY" not in captured
     assert "SECRET_TEST_KEY" not in captured
@@ -241,18 +299,19 @@ def test_client_cache_key_print_and_repr_do_not_expose_sensitive_data(
     assert "aws_session_token=***" in rendered
 
 
-def test_client_cache_factory_returns_registered_lru_subclass() -> None:
-    cache = ClientCache()
-
-    assert isinstance(cache, LRUClientCache)
-    assert type(cache) is _ClientCacheRegistry.registry["LRU"]
-
-
-def test_client_cache_factory_returns_registered_lfu_subclass() -> None:
-    cache = ClientCache("LFU")
+@pytest.mark.parametrize(
+    ("policy", "expected_cls"),
+    [(None, LRUClientCache), ("LFU", LFUClientCache)],
+)
+def test_client_cache_factory_returns_registered_subclass(
+    policy: str | None,
+    expected_cls: type[_ClientCacheType],
+) -> None:
+    # ``None`` exercises the default eviction policy
+    cache = ClientCache() if policy is None else ClientCache(policy)
 
-    assert isinstance(cache, LFUClientCache)
-    assert type(cache) is _ClientCacheRegistry.registry["LFU"]
+    assert isinstance(cache, expected_cls)
+    assert type(cache) is _ClientCacheRegistry.registry[policy or "LRU"]
 
 
 def test_client_cache_factory_rejects_unsupported_eviction_policy() -> None:
@@ -260,23 +319,11 @@ def test_client_cache_factory_rejects_unsupported_eviction_policy() -> None:
         ClientCache("FIFO")  # type: ignore[call-arg]
 
 
-def test_lru_cache_init_max_size_and_resizing_with_eviction() -> None:
-    cache = LRUClientCache(max_size=-3)
-    keys = [ClientCacheKey(f"svc{i}") for i in range(3)]
-
-    for index, key in enumerate(keys):
-        cache[key] = _client(f"c{index}")
-
-    assert cache.max_size == 3
-    assert tuple(cache.keys()) == tuple(keys)
-
-    cache.max_size = -1
-    assert cache.max_size == 1
-    assert cache.keys() == (keys[-1],)
-
-
-def test_lru_cache_string_repr_for_empty_and_populated_cache() -> None:
-    cache = LRUClientCache()
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+def test_cache_string_repr_for_empty_and_populated_cache(
+    cache_cls: type[_ClientCacheType],
+) -> None:
+    cache = cache_cls()
     assert str(cache) == "ClientCache(empty)"
     assert repr(cache) == "ClientCache(empty)"
 
@@ -289,39 +336,7 @@ def test_lru_cache_string_repr_for_empty_and_populated_cache() -> None:
     assert repr(cache) == rendered
 
 
-def test_lru_cache_dict_protocol_and_iteration_order() -> None:
-    cache = LRUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-
-    cache[first] = _client("first")
-    cache[second] = _client("second")
-
-    assert len(cache) == 2
-    assert first in cache
-    assert list(iter(cache)) == [first, second]
-    assert list(reversed(cache)) == [second, first]
-
-
-def test_lru_cache_getitem_marks_client_recent_and_miss_raises() -> None:
-    cache = LRUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
-
-    cache[first] = _client("first")
-    cache[second] = _client("second")
-    _ = cache[first]  # move first to MRU
-    cache[third] = _client("third")
-
-    assert first in cache
-    assert third in cache
-    assert second not in cache
-
-    with pytest.raises(ClientCacheNotFoundError):
-        _ = cache[ClientCacheKey("missing")]
-
-
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
 @pytest.mark.parametrize(
     ("key", "obj", "error", "message"),
     [
@@ -329,29 +344,38 @@ def test_lru_cache_getitem_marks_client_recent_and_miss_raises() -> None:
         (ClientCacheKey("s3"), object(), ClientCacheError, "Cache value must"),
     ],
 )
-def test_lru_cache_setitem_validates_types(
+def test_cache_setitem_validates_types(
+    cache_cls: type[_ClientCacheType],
     key: object,
     obj: object,
     error: type[Exception],
     message: str,
 ) -> None:
-    cache = LRUClientCache()
+    cache = cache_cls()
     with pytest.raises(error, match=message):
         cache[key] = obj  # type: ignore[index]
 
 
-def test_lru_cache_setitem_duplicate_key_raises_exists_error() -> None:
-    cache = LRUClientCache()
-    key = ClientCacheKey("s3")
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+def test_cache_setitem_duplicate_key_raises_exists_error(
+    cache_cls: type[_ClientCacheType],
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = cache_cls()
+    key = client_keys.s3
     cache[key] = _client("first")
 
     with pytest.raises(ClientCacheExistsError, match="already exists"):
         cache[key] = _client("second")
 
 
-def test_lru_cache_delete_and_missing_delete() -> None:
-    cache = LRUClientCache()
-    key = ClientCacheKey("s3")
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+def test_cache_delete_and_missing_delete(
+    cache_cls: type[_ClientCacheType],
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = cache_cls()
+    key = client_keys.s3
     cache[key] = _client("value")
 
     del cache[key]
@@ -361,10 +385,132 @@ def test_lru_cache_delete_and_missing_delete() -> None:
         del cache[key]
 
 
-def test_lru_cache_keys_values_items_are_tuples_and_snapshots() -> None:
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+def test_cache_pop_and_popitem_and_clear(
+    cache_cls: type[_ClientCacheType],
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = cache_cls()
+    first = client_keys.s3
+    second = client_keys.sns
+    first_client = _client("first")
+    second_client = _client("second")
+    cache[first] = first_client
+    cache[second] = second_client
+
+    assert cache.pop(first) is first_client
+    assert first not in cache
+
+    popped_key, popped_obj = cache.popitem()
+    assert popped_key == second
+    assert popped_obj is second_client
+    assert len(cache) == 0
+
+    with pytest.raises(ClientCacheNotFoundError, match="No clients found"):
+        cache.popitem()
+
+    with pytest.raises(ClientCacheNotFoundError, match="Client not found"):
+        cache.pop(first)
+
+    cache[client_keys.sqs] = _client("third")
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+@pytest.mark.parametrize("operation", _LOCKED_OPERATIONS)
+def test_cache_uses_lock_for_core_operations(
+    cache_cls: type[_ClientCacheType],
+    operation: Callable[[_ClientCacheType, SimpleNamespace], object],
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = cache_cls()
+    key = client_keys.s3
+    cache[key] = _client("value")
+    lock = _TrackingLock()
+    cache._lock = lock  # type: ignore[assignment]
+
+    operation(cache, client_keys)
+
+    assert lock.enter_count > 0
+    assert lock.enter_count == lock.exit_count
+
+
+@pytest.mark.parametrize("cache_cls", _CACHE_CLASSES)
+def test_cache_excluded_dict_methods_are_not_supported(
+    cache_cls: type[_ClientCacheType],
+) -> None:
+    cache = cache_cls()
+
+    assert not hasattr(cache, "update")
+    assert not hasattr(cache, "setdefault")
+    assert not hasattr(cache_cls, "fromkeys")
+
+    with pytest.raises(TypeError):
+        _ = cache | {}  # type: ignore[operator]
+
+    with pytest.raises(TypeError):
+        cache |= {}  # type: ignore[operator]
+
+
+def test_lru_cache_init_max_size_and_resizing_with_eviction() -> None:
+    cache = LRUClientCache(max_size=-3)
+    keys = [ClientCacheKey(f"svc{i}") for i in range(3)]
+
+    for index, key in enumerate(keys):
+        cache[key] = _client(f"c{index}")
+
+    assert cache.max_size == 3
+    assert tuple(cache.keys()) == tuple(keys)
+
+    cache.max_size = -1
+    assert cache.max_size == 1
+    assert cache.keys() == (keys[-1],)
+
+
+def test_lru_cache_dict_protocol_and_iteration_order(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LRUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
+    first = client_keys.s3
+    second = client_keys.sns
+
+    cache[first] = _client("first")
+    cache[second] = _client("second")
+
+    assert len(cache) == 2
+    assert first in cache
+    assert tuple(cache) == (first, second)
+    assert tuple(reversed(cache)) == (second, first)
+
+
+def test_lru_cache_getitem_marks_client_recent_and_miss_raises(
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = LRUClientCache(max_size=2)
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
+
+    cache[first] = _client("first")
+    cache[second] = _client("second")
+    _ = cache[first]  # move first to MRU
+    cache[third] = _client("third")
+
+    assert first in cache
+    assert third in cache
+    assert second not in cache
+
+    with pytest.raises(ClientCacheNotFoundError):
+        _ = cache[client_keys.missing]
+
+
+def test_lru_cache_keys_values_items_are_tuples_and_snapshots(
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = LRUClientCache()
+    first = client_keys.s3
+    second = client_keys.sns
     first_client = _client("first")
     second_client = _client("second")
     cache[first] = first_client
@@ -384,7 +530,7 @@ def test_lru_cache_keys_values_items_are_tuples_and_snapshots() -> None:
         (second, second_client),
     )
 
-    cache[ClientCacheKey("sqs")] = _client("third")
+    cache[client_keys.sqs] = _client("third")
     assert keys_snapshot == (first, second)
     assert values_snapshot == (first_client, second_client)
     assert items_snapshot == (
@@ -393,11 +539,35 @@ def test_lru_cache_keys_values_items_are_tuples_and_snapshots() -> None:
     )
 
 
-def test_lru_cache_get_returns_default_and_marks_hit_recent() -> None:
+def test_lru_cache_iter_items_is_lazy_and_skips_removed_keys(
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = LRUClientCache()
+    first = client_keys.s3
+    second = client_keys.sns
+    first_obj = _client("first")
+    second_obj = _client("second")
+    cache[first] = first_obj
+    cache[second] = second_obj
+
+    assert tuple(cache.iter_items()) == (
+        (first, first_obj),
+        (second, second_obj),
+    )
+
+    items = cache.iter_items()
+    assert next(items) == (first, first_obj)
+    del cache[second]
+    assert tuple(items) == ()
+
+
+def test_lru_cache_get_returns_default_and_marks_hit_recent(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LRUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
     first_client = _client("first")
     second_client = _client("second")
     default = _client("default")
@@ -408,40 +578,14 @@ def test_lru_cache_get_returns_default_and_marks_hit_recent() -> None:
     assert cache.get(first) is first_client
     cache[third] = _client("third")
     assert second not in cache
-    assert cache.get(ClientCacheKey("missing"), default) is default
+    assert cache.get(client_keys.missing, default) is default
 
 
-def test_lru_cache_pop_and_popitem_and_clear() -> None:
-    cache = LRUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    first_client = _client("first")
-    second_client = _client("second")
-    cache[first] = first_client
-    cache[second] = second_client
-
-    assert cache.pop(first) is first_client
-    assert first not in cache
-
-    lru_key, lru_client = cache.popitem()
-    assert lru_key == second
-    assert lru_client is second_client
-    assert len(cache) == 0
-
-    with pytest.raises(ClientCacheNotFoundError, match="No clients found"):
-        cache.popitem()
-
-    with pytest.raises(ClientCacheNotFoundError, match="Client not found"):
-        cache.pop(first)
-
-    cache[ClientCacheKey("sqs")] = _client("third")
-    cache.clear()
-    assert len(cache) == 0
-
-
-def test_lru_cache_copy_is_independent_but_shallow() -> None:
+def test_lru_cache_copy_is_independent_but_shallow(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LRUClientCache(max_size=5)
-    key = ClientCacheKey("s3")
+    key = client_keys.s3
     client = _client("original")
     cache[key] = client
 
@@ -455,47 +599,6 @@ def test_lru_cache_copy_is_independent_but_shallow() -> None:
     assert key in cache
 
 
-def test_lru_cache_uses_lock_for_core_operations() -> None:
-    cache = LRUClientCache()
-    lock = _TrackingLock()
-    cache._lock = lock  # type: ignore[assignment]
-    key = ClientCacheKey("s3")
-    client = _client("value")
-
-    cache[key] = client
-    _ = cache.get(key)
-    _ = cache[key]
-    _ = len(cache)
-    _ = list(cache)
-    _ = key in cache
-    _ = cache.keys()
-    _ = cache.values()
-    _ = cache.items()
-    _ = str(cache)
-    _ = repr(cache)
-    _ = list(reversed(cache))
-    cache.max_size = 10
-    _ = cache.pop(key)
-    cache.clear()
-
-    assert lock.enter_count > 0
-    assert lock.enter_count == lock.exit_count
-
-
-def test_lru_cache_excluded_dict_methods_are_not_supported() -> None:
-    cache = LRUClientCache()
-
-    assert not hasattr(cache, "update")
-    assert not hasattr(cache, "setdefault")
-    assert not hasattr(LRUClientCache, "fromkeys")
-
-    with pytest.raises(TypeError):
-        _ = cache | {}  # type: ignore[operator]
-
-    with pytest.raises(TypeError):
-        cache |= {}  # type: ignore[operator]
-
-
 def test_lfu_cache_init_max_size_and_resizing_with_eviction() -> None:
     cache = LFUClientCache(max_size=-3)
     keys = [ClientCacheKey(f"svc{i}") for i in range(3)]
@@ -512,24 +615,12 @@ def test_lfu_cache_init_max_size_and_resizing_with_eviction() -> None:
     assert cache.keys() == (keys[0],)
 
 
-def test_lfu_cache_string_repr_for_empty_and_populated_cache() -> None:
-    cache = LFUClientCache()
-    assert str(cache) == "ClientCache(empty)"
-    assert repr(cache) == "ClientCache(empty)"
-
-    key = ClientCacheKey("s3", region_name="us-east-1")
-    cache[key] = _client("s3")
-
-    rendered = str(cache)
-    assert rendered.startswith("ClientCache:\n")
-    assert f"RefreshableSession.client({key.label})" in rendered
-    assert repr(cache) == rendered
-
-
-def test_lfu_cache_dict_protocol_and_iteration_order() -> None:
+def test_lfu_cache_dict_protocol_and_iteration_order(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LFUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
+    first = client_keys.s3
+    second = client_keys.sns
 
     cache[first] = _client("first")
     cache[second] = _client("second")
@@ -537,15 +628,17 @@ def test_lfu_cache_dict_protocol_and_iteration_order() -> None:
 
     assert len(cache) == 2
     assert first in cache
-    assert list(iter(cache)) == [second, first]
-    assert list(reversed(cache)) == [first, second]
+    assert tuple(cache) == (second, first)
+    assert tuple(reversed(cache)) == (first, second)
 
 
-def test_lfu_cache_getitem_marks_client_frequent_and_miss_raises() -> None:
+def test_lfu_cache_getitem_marks_client_frequent_and_miss_raises(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LFUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
 
     cache[first] = _client("first")
     cache[second] = _client("second")
@@ -557,14 +650,16 @@ def test_lfu_cache_getitem_marks_client_frequent_and_miss_raises() -> None:
     assert second not in cache
 
     with pytest.raises(ClientCacheNotFoundError):
-        _ = cache[ClientCacheKey("missing")]
+        _ = cache[client_keys.missing]
 
 
-def test_lfu_cache_tie_breaker_eviction_is_lru_within_frequency() -> None:
+def test_lfu_cache_tie_breaker_eviction_is_lru_within_frequency(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LFUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
 
     cache[first] = _client("first")
     cache[second] = _client("second")
@@ -575,49 +670,12 @@ def test_lfu_cache_tie_breaker_eviction_is_lru_within_frequency() -> None:
     assert third in cache
 
 
-@pytest.mark.parametrize(
-    ("key", "obj", "error", "message"),
-    [
-        ("not-a-key", _client("good"), ClientCacheError, "Cache key must"),
-        (ClientCacheKey("s3"), object(), ClientCacheError, "Cache value must"),
-    ],
-)
-def test_lfu_cache_setitem_validates_types(
-    key: object,
-    obj: object,
-    error: type[Exception],
-    message: str,
+def test_lfu_cache_keys_values_items_are_tuples_and_snapshots(
+    client_keys: SimpleNamespace,
 ) -> None:
     cache = LFUClientCache()
-    with pytest.raises(error, match=message):
-        cache[key] = obj  # type: ignore[index]
-
-
-def test_lfu_cache_setitem_duplicate_key_raises_exists_error() -> None:
-    cache = LFUClientCache()
-    key = ClientCacheKey("s3")
-    cache[key] = _client("first")
-
-    with pytest.raises(ClientCacheExistsError, match="already exists"):
-        cache[key] = _client("second")
-
-
-def test_lfu_cache_delete_and_missing_delete() -> None:
-    cache = LFUClientCache()
-    key = ClientCacheKey("s3")
-    cache[key] = _client("value")
-
-    del cache[key]
-    assert key not in cache
-
-    with pytest.raises(ClientCacheNotFoundError, match="Client not found"):
-        del cache[key]
-
-
-def test_lfu_cache_keys_values_items_are_tuples_and_snapshots() -> None:
-    cache = LFUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
+    first = client_keys.s3
+    second = client_keys.sns
     first_client = _client("first")
     second_client = _client("second")
     cache[first] = first_client
@@ -638,7 +696,7 @@ def test_lfu_cache_keys_values_items_are_tuples_and_snapshots() -> None:
         (first, first_client),
     )
 
-    cache[ClientCacheKey("sqs")] = _client("third")
+    cache[client_keys.sqs] = _client("third")
     assert keys_snapshot == (second, first)
     assert values_snapshot == (second_client, first_client)
     assert items_snapshot == (
@@ -647,11 +705,36 @@ def test_lfu_cache_keys_values_items_are_tuples_and_snapshots() -> None:
     )
 
 
-def test_lfu_cache_get_returns_default_and_marks_hit_frequent() -> None:
+def test_lfu_cache_iter_items_is_lazy_and_skips_removed_keys(
+    client_keys: SimpleNamespace,
+) -> None:
+    cache = LFUClientCache()
+    first = client_keys.s3
+    second = client_keys.sns
+    first_obj = _client("first")
+    second_obj = _client("second")
+    cache[first] = first_obj
+    cache[second] = second_obj
+    _ = cache[first]
+
+    assert tuple(cache.iter_items()) == (
+        (second, second_obj),
+        (first, first_obj),
+    )
+
+    items = cache.iter_items()
+    assert next(items) == (second, second_obj)
+    del cache[first]
+    assert tuple(items) == ()
+
+
+def test_lfu_cache_get_returns_default_and_marks_hit_frequent(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LFUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
     first_client = _client("first")
     second_client = _client("second")
     default = _client("default")
@@ -662,42 +745,16 @@ def test_lfu_cache_get_returns_default_and_marks_hit_frequent() -> None:
     assert cache.get(first) is first_client
     cache[third] = _client("third")
     assert second not in cache
-    assert cache.get(ClientCacheKey("missing"), default) is default
+    assert cache.get(client_keys.missing, default) is default
 
 
-def test_lfu_cache_pop_and_popitem_and_clear() -> None:
-    cache = LFUClientCache()
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    first_client = _client("first")
-    second_client = _client("second")
-    cache[first] = first_client
-    cache[second] = second_client
-
-    assert cache.pop(first) is first_client
-    assert first not in cache
-
-    lfu_key, lfu_client = cache.popitem()
-    assert lfu_key == second
-    assert lfu_client is second_client
-    assert len(cache) == 0
-
-    with pytest.raises(ClientCacheNotFoundError, match="No clients found"):
-        cache.popitem()
-
-    with pytest.raises(ClientCacheNotFoundError, match="Client not found"):
-        cache.pop(first)
-
-    cache[ClientCacheKey("sqs")] = _client("third")
-    cache.clear()
-    assert len(cache) == 0
-
-
-def test_lfu_cache_copy_is_independent_but_shallow() -> None:
+def test_lfu_cache_copy_is_independent_but_shallow(
+    client_keys: SimpleNamespace,
+) -> None:
     cache = LFUClientCache(max_size=2)
-    first = ClientCacheKey("s3")
-    second = ClientCacheKey("sns")
-    third = ClientCacheKey("sqs")
+    first = client_keys.s3
+    second = client_keys.sns
+    third = client_keys.sqs
     first_client = _client("first")
     second_client = _client("second")
     cache[first] = first_client
@@ -714,44 +771,3 @@ def test_lfu_cache_copy_is_independent_but_shallow() -> None:
     copied[third] = _client("third")
     assert second not in copied
     assert second in cache
-
-
-def test_lfu_cache_uses_lock_for_core_operations() -> None:
-    cache = LFUClientCache()
-    lock = _TrackingLock()
-    cache._lock = lock  # type: ignore[assignment]
-    key = ClientCacheKey("s3")
-    client = _client("value")
-
-    cache[key] = client
-    _ = cache.get(key)
-    _ = cache[key]
-    _ = len(cache)
-    _ = list(cache)
-    _ = key in cache
-    _ = cache.keys()
-    _ = cache.values()
-    _ = cache.items()
-    _ = str(cache)
-    _ = repr(cache)
-    _ = list(reversed(cache))
-    cache.max_size = 10
-    _ = cache.pop(key)
-    cache.clear()
-
-    assert lock.enter_count > 0
-    assert lock.enter_count == lock.exit_count
-
-
-def test_lfu_cache_excluded_dict_methods_are_not_supported() -> None:
-    cache = LFUClientCache()
-
-    assert not hasattr(cache, "update")
-    assert not hasattr(cache, "setdefault")
-    assert not hasattr(LFUClientCache, "fromkeys")
-
-    with pytest.raises(TypeError):
-        _ = cache | {}  # type: ignore[operator]
-
-    with pytest.raises(TypeError):
-        cache |= {}  # type: ignore[operator]
@@ -12,23 +12,37 @@ import boto3_client_cache as bcc
 import boto3_client_cache.session as session_mod
 from boto3_client_cache.exceptions import ClientCacheError, ResourceCacheError
 
+from ._fakes import FakeClient, FakeResource
+
 
 @pytest.fixture(autouse=True)
-def _restore_default_session() -> None:
-    original = boto3.DEFAULT_SESSION
-    boto3.DEFAULT_SESSION = None
-    try:
-        yield
-    finally:
-        boto3.DEFAULT_SESSION = original
+def _restore_default_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    # monkeypatch restores the original default session after each test
+    monkeypatch.setattr(boto3, "DEFAULT_SESSION", None)
 
 
 def _mock_client(name: str = "client") -> BaseClient:
-    return MagicMock(spec=BaseClient, name=name)
+    return FakeClient(name)
 
 
 def _mock_resource(name: str = "resource") -> ServiceResource:
-    return MagicMock(spec=ServiceResource, name=name)
+    return FakeResource(name)
+
+
+def _patch_super_method(
+    monkeypatch: pytest.MonkeyPatch, kind: str
+) -> list[object]:
+    # patches boto3.Session.<kind> to hand out a new stub on every call
+    created: list[object] = []
+    make = _mock_client if kind == "client" else _mock_resource
+
+    def fake_super(_self: boto3.Session, *args, **kwargs) -> object:
+        obj = make(f"{kind}_{len(created)}")
+        created.append(obj)
+        return obj
+
+    monkeypatch.setattr(boto3.Session, kind, fake_super)
+    return created
 
 
 def test_package_exports_boto3_like_session_helpers() -> None:
@@ -97,134 +111,74 @@ def test_module_resource_wrapper_allows_service_name_positional_without_max_size
     )
 
 
-def test_session_client_caches_by_call_signature(
+@pytest.mark.parametrize("kind", ["client", "resource"])
+def test_session_caches_by_call_signature(
     monkeypatch: pytest.MonkeyPatch,
+    kind: str,
 ) -> None:
-    created: list[BaseClient] = []
-
-    def fake_super_client(_self: boto3.Session, *args, **kwargs) -> BaseClient:
-        client = _mock_client(f"client_{len(created)}")
-        created.append(client)
-        return client
-
-    monkeypatch.setattr(boto3.Session, "client", fake_super_client)
+    created = _patch_super_method(monkeypatch, kind)
     session = session_mod.Session(region_name="us-east-1")
+    method: Callable[..., object] = getattr(session, kind)
 
-    first = session.client("s3", region_name="us-east-1")
-    second = session.client("s3", region_name="us-east-1")
-    third = session.client("s3", region_name="us-west-2")
+    first = method("s3", region_name="us-east-1")
+    second = method("s3", region_name="us-east-1")
+    third = method("s3", region_name="us-west-2")
 
     assert first is second
     assert third is not first
     assert len(created) == 2
 
 
-def test_session_resource_caches_by_call_signature(
+@pytest.mark.parametrize("kind", ["client", "resource"])
+def test_session_uses_separate_caches_per_eviction_policy(
     monkeypatch: pytest.MonkeyPatch,
+    kind: str,
 ) -> None:
-    created: list[ServiceResource] = []
-
-    def fake_super_resource(
-        _self: boto3.Session, *args, **kwargs
-    ) -> ServiceResource:
-        resource = _mock_resource(f"resource_{len(created)}")
-        created.append(resource)
-        return resource
-
-    monkeypatch.setattr(boto3.Session, "resource", fake_super_resource)
+    created = _patch_super_method(monkeypatch, kind)
     session = session_mod.Session(region_name="us-east-1")
+    method: Callable[..., object] = getattr(session, kind)
 
-    first = session.resource("s3", region_name="us-east-1")
-    second = session.resource("s3", region_name="us-east-1")
-    third = session.resource("s3", region_name="us-west-2")
+    default_lru = method("s3")
+    explicit_lru = method("s3", eviction_policy="LRU")
+    lfu = method("s3", eviction_policy="LFU")
 
-    assert first is second
-    assert third is not first
+    assert default_lru is explicit_lru
+    assert lfu is not default_lru
     assert len(created) == 2
 
 
 @pytest.mark.parametrize(
-    ("method_name", "error_type"),
+    ("method", "error_type"),
     [
-        ("client", ClientCacheError),
-        ("resource", ResourceCacheError),
+        (session_mod.Session.client, ClientCacheError),
+        (session_mod.Session.resource, ResourceCacheError),
     ],
 )
 def test_session_methods_validate_eviction_policy(
-    method_name: str,
+    method: Callable[..., object],
     error_type: type[Exception],
 ) -> None:
     session = session_mod.Session(region_name="us-east-1")
 
-    method: Callable[..., object] = getattr(session, method_name)
-
     with pytest.raises(error_type, match="Invalid eviction policy"):
-        method("s3", eviction_policy="BAD")  # type: ignore[arg-type]
+        method(session, "s3", eviction_policy="BAD")
 
 
 @pytest.mark.parametrize(
-    ("wrapper_name", "error_type"),
+    ("wrapper", "error_type"),
     [
-        ("client", ClientCacheError),
-        ("resource", ResourceCacheError),
+        (session_mod.client, ClientCacheError),
+        (session_mod.resource, ResourceCacheError),
     ],
 )
 def test_module_wrappers_validate_eviction_policy(
-    wrapper_name: str,
+    wrapper: Callable[..., object],
     error_type: type[Exception],
 ) -> None:
-    wrapper: Callable[..., object] = getattr(session_mod, wrapper_name)
-
     with pytest.raises(error_type, match="Invalid eviction policy"):
         wrapper("s3", eviction_policy="BAD")  # type: ignore[arg-type]
 
 
-def test_session_client_uses_separate_caches_per_eviction_policy(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    created: list[BaseClient] = []
-
-    def fake_super_client(_self: boto3.Session, *args, **kwargs) -> BaseClient:
-        client = _mock_client(f"client_{len(created)}")
-        created.append(client)
-        return client
-
-    monkeypatch.setattr(boto3.Session, "client", fake_super_client)
-    session = session_mod.Session(region_name="us-east-1")
-
-    default_lru = session.client("s3")
-    explicit_lru = session.client("s3", eviction_policy="LRU")
-    lfu = session.client("s3", eviction_policy="LFU")
-
-    assert default_lru is explicit_lru
-    assert lfu is not default_lru
-    assert len(created) == 2
-
-
-def test_session_resource_uses_separate_caches_per_eviction_policy(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    created: list[ServiceResource] = []
-
-    def fake_super_resource(
-        _self: boto3.Session, *args, **kwargs
-    ) -> ServiceResource:
-        resource = _mock_resource(f"resource_{len(created)}")
-        created.append(resource)
-        return resource
-
-    monkeypatch.setattr(boto3.Session, "resource", fake_super_resource)
-    session = session_mod.Session(region_name="us-east-1")
-
-    default_lru = session.resource("s3")
-    explicit_lru = session.resource("s3", eviction_policy="LRU")
-    lfu = session.resource("s3", eviction_policy="LFU")
-
-    assert default_lru is explicit_lru
-    assert lfu is not default_lru
-    assert len(created) == 2
-
-
 def test_session_client_updates_cache_max_size_when_provided(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -276,3 +230,26 @@ def test_session_caches_are_not_shared_across_session_instances() -> None:
     assert first.cache.client["LFU"] is not second.cache.client["LFU"]
     assert first.cache.resource["LRU"] is not second.cache.resource["LRU"]
     assert first.cache.resource["LFU"] is not second.cache.resource["LFU"]
+
+
+@pytest.mark.parametrize("kind", ["client", "resource"])
+def test_module_wrappers_rebind_when_default_session_is_replaced(
+    monkeypatch: pytest.MonkeyPatch, kind: str
+) -> None:
+    _patch_super_method(monkeypatch, kind)
+    wrapper = getattr(session_mod, kind)
+
+    first = session_mod.setup_default_session(region_name="us-east-1")
+    first_obj = wrapper("s3")
+    assert wrapper("s3") is first_obj
+    assert first_obj in first.cache[kind]["LRU"].values()
+
+    second = session_mod.setup_default_session(region_name="us-west-2")
+    second_obj = wrapper("s3")
+    assert second_obj is not first_obj
+    assert second_obj in second.cache[kind]["LRU"].values()
+
+    boto3.DEFAULT_SESSION = None
+    third_obj = wrapper("s3")
+    assert boto3.DEFAULT_SESSION is not second
+    assert third_obj is not second_obj